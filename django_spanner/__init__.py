@@ -10,9 +10,8 @@ import django
 
 # Monkey-patch AutoField to generate a random value since Cloud Spanner can't
 # do that.
-from uuid import uuid4
+from secrets import randbits
 
-import pkg_resources
 from google.cloud.spanner_v1 import JsonObject
 from django.db.models.fields import (
     NOT_PROVIDED,
@@ -20,28 +19,27 @@ from django.db.models.fields import (
     Field,
 )
 
-from .expressions import register_expressions
-from .functions import register_functions
-from .lookups import register_lookups
 from .utils import check_django_compatability
 
 # Monkey-patch google.DatetimeWithNanoseconds's __eq__ compare against
 # datetime.datetime.
 from google.api_core.datetime_helpers import DatetimeWithNanoseconds
 
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # Python < 3.8
+    from importlib_metadata import PackageNotFoundError, version
 
-USING_DJANGO_3 = False
-if django.VERSION[:2] == (3, 2):
-    USING_DJANGO_3 = True
+
+USING_DJANGO_3 = django.VERSION[:2] == (3, 2)
 
 if USING_DJANGO_3:
-    from django.db.models.fields import (
-        SmallAutoField,
-        BigAutoField,
-    )
     from django.db.models import JSONField
 
-__version__ = pkg_resources.get_distribution("django-google-spanner").version
+try:
+    __version__ = version("django-google-spanner")
+except PackageNotFoundError:
+    __version__ = "unknown"
 
 USE_EMULATOR = os.getenv("SPANNER_EMULATOR_HOST") is not None
 
@@ -49,14 +47,37 @@ USE_EMULATOR = os.getenv("SPANNER_EMULATOR_HOST") is not None
 SUPPORTED_DJANGO_VERSIONS = [(2, 2), (3, 2)]
 
 check_django_compatability(SUPPORTED_DJANGO_VERSIONS)
-register_expressions(USING_DJANGO_3)
-register_functions()
-register_lookups()
+
+# Django 3.2 finds DjangoSpannerConfig automatically.
+if not USING_DJANGO_3:
+    default_app_config = "django_spanner.apps.DjangoSpannerConfig"
+
+_registered = False
+
+
+def _register():
+    """
+    Register the Spanner-specific SQL for Django expressions, functions and
+    lookups. Called both when the backend is loaded (``ENGINE`` setting) and
+    from ``DjangoSpannerConfig.ready()``; only the first call does any work.
+    """
+    global _registered
+    if _registered:
+        return
+
+    from .expressions import register_expressions
+    from .functions import register_functions
+    from .lookups import register_lookups
+
+    register_expressions(USING_DJANGO_3)
+    register_functions()
+    register_lookups()
+    _registered = True
 
 
 def gen_rand_int64():
-    # Credit to https://stackoverflow.com/a/3530326.
-    return uuid4().int & 0x7FFFFFFFFFFFFFFF
+    # A positive INT64: 63 random bits straight from the OS entropy source.
+    return randbits(63)
 
 
 def autofield_init(self, *args, **kwargs):
@@ -70,20 +91,28 @@ def autofield_init(self, *args, **kwargs):
         self.default = gen_rand_int64
 
 
-AutoField.__init__ = autofield_init
-AutoField.db_returning = False
-AutoField.validators = []
+def _patch_autofields():
+    autofield_classes = [AutoField]
+    if USING_DJANGO_3:
+        from django.db.models.fields import BigAutoField, SmallAutoField
+
+        autofield_classes += [SmallAutoField, BigAutoField]
+
+    for autofield_class in autofield_classes:
+        autofield_class.__init__ = autofield_init
+        autofield_class.db_returning = False
+        autofield_class.validators = []
+
+
+_patch_autofields()
+
 if USING_DJANGO_3:
-    SmallAutoField.__init__ = autofield_init
-    BigAutoField.__init__ = autofield_init
-    SmallAutoField.db_returning = False
-    BigAutoField.db_returning = False
-    SmallAutoField.validators = []
-    BigAutoField.validators = []
 
     def get_prep_value(self, value):
         # Json encoding and decoding for spanner is done in python-spanner.
-        if not isinstance(value, JsonObject) and isinstance(value, dict):
+        if isinstance(value, JsonObject):
+            return value
+        if isinstance(value, dict):
             return JsonObject(value)
 
         return value
@@ -97,8 +126,13 @@ old_datetimewithnanoseconds_eq = getattr(
 
 
 def datetimewithnanoseconds_eq(self, other):
+    if self is other:
+        return True
+
     if old_datetimewithnanoseconds_eq:
         equal = old_datetimewithnanoseconds_eq(self, other)
+        if equal is NotImplemented:
+            return NotImplemented
         if equal:
             return True
         elif type(self) is type(other):
@@ -106,8 +140,25 @@ def datetimewithnanoseconds_eq(self, other):
 
     # Otherwise try to convert them to an equvialent form.
     # See https://github.com/googleapis/python-spanner-django/issues/272
+    # Compare the fields ctime() renders, without formatting two strings.
+    # This deliberately ignores microseconds and timezone, matching the
+    # previous ctime() comparison.
     if isinstance(other, datetime.datetime):
-        return self.ctime() == other.ctime()
+        return (
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+        ) == (
+            other.year,
+            other.month,
+            other.day,
+            other.hour,
+            other.minute,
+            other.second,
+        )
 
     return False
 
@@ -0,0 +1,23 @@
+# Copyright 2022 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+from django.apps import AppConfig
+
+
+class DjangoSpannerConfig(AppConfig):
+    """Django application config for the Spanner backend."""
+
+    name = "django_spanner"
+    verbose_name = "Django Spanner"
+
+    def ready(self):
+        """
+        Register the Spanner-specific SQL for Django expressions, functions
+        and lookups once the app registry is ready.
+        """
+        from . import _register
+
+        _register()
@@ -17,6 +17,11 @@ from .features import DatabaseFeatures
 from .introspection import DatabaseIntrospection
 from .operations import DatabaseOperations
 from .schema import DatabaseSchemaEditor
+from . import _register
+
+# The backend can be used through the ENGINE setting alone, without
+# django_spanner in INSTALLED_APPS, so register here as well.
+_register()
 
 
 class DatabaseWrapper(BaseDatabaseWrapper):
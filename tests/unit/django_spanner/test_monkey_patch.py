@@ -0,0 +1,142 @@
+# Copyright 2022 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import datetime
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+from unittest import mock
+
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from google.cloud.spanner_v1 import JsonObject
+
+import django_spanner
+from django_spanner import USING_DJANGO_3
+
+UTC = datetime.timezone.utc
+
+
+class TestDatetimeWithNanosecondsEq(unittest.TestCase):
+    def test_eq_non_datetime(self):
+        dtns = DatetimeWithNanoseconds(2020, 1, 10, 2, 44, 57, 999, UTC)
+        self.assertFalse(dtns == "x")
+        self.assertTrue(dtns != "x")
+
+    def test_eq_datetime_same_second(self):
+        dtns = DatetimeWithNanoseconds(2020, 1, 10, 2, 44, 57, 999, UTC)
+        dt = datetime.datetime(2020, 1, 10, 2, 44, 57, 999, UTC)
+        self.assertTrue(dtns == dt)
+
+    def test_eq_datetime_ignores_microsecond_and_tz(self):
+        dtns = DatetimeWithNanoseconds(2020, 1, 10, 2, 44, 57, 999, UTC)
+        dt = datetime.datetime(2020, 1, 10, 2, 44, 57, 5)
+        self.assertTrue(dtns == dt)
+
+    def test_eq_datetime_different_second(self):
+        dtns = DatetimeWithNanoseconds(2020, 1, 10, 2, 44, 57, 999, UTC)
+        dt = datetime.datetime(2020, 1, 10, 2, 44, 58)
+        self.assertFalse(dtns == dt)
+
+
+@unittest.skipUnless(USING_DJANGO_3, "JSONField requires Django 3.2")
+class TestJSONFieldGetPrepValue(unittest.TestCase):
+    def setUp(self):
+        from django.db.models import JSONField
+
+        self.field = JSONField()
+
+    def test_plain_dict(self):
+        value = self.field.get_prep_value({"a": 1})
+        self.assertIsInstance(value, JsonObject)
+        self.assertEqual(value, {"a": 1})
+
+    def test_json_object(self):
+        json_object = JsonObject({"a": 1})
+        self.assertIs(self.field.get_prep_value(json_object), json_object)
+
+    def test_dict_subclass(self):
+        class DictSubclass(dict):
+            pass
+
+        value = self.field.get_prep_value(DictSubclass(a=1))
+        self.assertIsInstance(value, JsonObject)
+        self.assertEqual(value, {"a": 1})
+
+    def test_non_dict(self):
+        value = [1, 2]
+        self.assertIs(self.field.get_prep_value(value), value)
+        self.assertIsNone(self.field.get_prep_value(None))
+
+
+class TestRegistration(unittest.TestCase):
+    def test_register_once(self):
+        with mock.patch.object(django_spanner, "_registered", False):
+            with mock.patch(
+                "django_spanner.lookups.register_lookups"
+            ) as register_lookups:
+                django_spanner._register()
+                django_spanner._register()
+        register_lookups.assert_called_once_with()
+
+    def test_app_config_ready_registers(self):
+        from django.apps import apps
+
+        with mock.patch("django_spanner._register") as register:
+            apps.get_app_config("django_spanner").ready()
+        register.assert_called_once_with()
+
+    def test_default_app_config(self):
+        if USING_DJANGO_3:
+            self.assertFalse(hasattr(django_spanner, "default_app_config"))
+        else:
+            self.assertEqual(
+                django_spanner.default_app_config,
+                "django_spanner.apps.DjangoSpannerConfig",
+            )
+
+    def test_registered_without_installed_apps(self):
+        """Loading the backend through ENGINE alone installs the hooks."""
+        script = textwrap.dedent(
+            """
+            import django
+            from django.conf import settings
+
+            settings.configure(
+                DATABASES={
+                    "default": {
+                        "ENGINE": "django_spanner",
+                        "PROJECT": "project",
+                        "INSTANCE": "instance",
+                        "NAME": "database",
+                    }
+                }
+            )
+            django.setup()
+
+            from django.apps import apps
+            from django.db import connections
+            from django.db.models.functions import Cot
+            from django.db.models.lookups import Contains
+
+            assert not apps.is_installed("django_spanner")
+            assert not hasattr(Contains, "as_spanner")
+            connections["default"]
+            assert hasattr(Contains, "as_spanner")
+            assert hasattr(Cot, "as_spanner")
+            """
+        )
+        env = dict(os.environ)
+        env.pop("DJANGO_SETTINGS_MODULE", None)
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
@@ -411,6 +411,14 @@ class TestUtils(SpannerSimpleTestClass):
         field = AutoField(name="field_name")
         assert gen_rand_int64 == field.default
 
+    def test_gen_rand_int64(self):
+        """Generated primary keys are 63 random bits (a positive INT64)."""
+        with mock.patch(
+            "django_spanner.randbits", return_value=42
+        ) as randbits:
+            assert gen_rand_int64() == 42
+        randbits.assert_called_once_with(63)
+
     def test_autofield_default(self):
         """Spanner, default provided."""
         mock_func = mock.Mock()